@@ -115,6 +115,7 @@ from gammapy.datasets import (
 from gammapy.estimators import FluxPointsEstimator
 from gammapy.estimators.utils import resample_energy_edges
 from gammapy.makers import (
+    DatasetsMaker,
     ReflectedRegionsBackgroundMaker,
     SafeMaskMaker,
     SpectrumDatasetMaker,
@@ -210,20 +211,19 @@ dataset_maker = SpectrumDatasetMaker(
 bkg_maker = ReflectedRegionsBackgroundMaker(exclusion_mask=exclusion_mask)
 safe_mask_maker = SafeMaskMaker(methods=["aeff-max"], aeff_percent=10)
 
-datasets = Datasets()
-
-for obs_id, observation in zip(obs_ids, observations):
-    dataset = dataset_maker.run(dataset_empty.copy(name=str(obs_id)), observation)
-    dataset_on_off = bkg_maker.run(dataset, observation)
-    dataset_on_off = safe_mask_maker.run(dataset_on_off, observation)
-    datasets.append(dataset_on_off)
+makers = [dataset_maker, bkg_maker, safe_mask_maker]  # the order matters
+datasets_maker = DatasetsMaker(makers, stack_datasets=False, n_jobs=4)
+datasets = datasets_maker.run(dataset_empty, observations)
 
 print(datasets)
 
 ######################################################################
-# The data reduction loop can also be performed through the
-# `~gammapy.makers.DatasetsMaker` class that take a list of makers as input,
-# as described :doc:`here </tutorials/details/makers>`
+# The `~gammapy.makers.DatasetsMaker` class takes a list of makers as
+# input and runs the reduction chain per observation, dispatching the
+# independent observations to ``n_jobs`` processes, as described
+# :doc:`here </tutorials/details/makers>`. The same reduction can also be
+# written as an explicit Python loop over the observations, at the price
+# of running sequentially.
 
 
 ######################################################################
@@ -425,10 +425,13 @@ plt.show()
 #
 # An alternative approach to fitting the spectrum is stacking all
 # observations first and the fitting a model. For this we first stack the
-# individual datasets:
+# individual datasets, accumulating each one in-place into the stacked
+# dataset instead of going through `~gammapy.datasets.Datasets.stack_reduce`:
 #
 
-dataset_stacked = Datasets(datasets).stack_reduce()
+dataset_stacked = datasets[0].to_masked(name="stacked")
+for dataset in datasets[1:]:
+    dataset_stacked.stack(dataset)
 
 
 ######################################################################
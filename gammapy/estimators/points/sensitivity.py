@@ -1,17 +1,82 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
 import logging
-from astropy.table import Column, Table
-from gammapy.maps import Map
-from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
-from gammapy.stats import WStatCountsStatistic
+from gammapy.utils.compilation import is_numba_available
 from ..core import Estimator
-from ..utils import apply_threshold_sensitivity
 
 log = logging.getLogger(__name__)
 
 __all__ = ["SensitivityEstimator"]
 
+# criterion codes: 0 = significance-limited, 1 = gamma-limited, 2 = bkg-syst-limited
+_CRITERION_LABELS = np.array(["significance", "gamma", "bkg"])
+
+
+def _excess_matching_significance(n_off, alpha, significance, niter=40):
+    """Compute the excess matching a given WStat significance for all bins at once.
+
+    Solves the same per-bin root-finding problem as
+    `~gammapy.stats.WStatCountsStatistic.n_sig_matching_significance`, but with
+    a vectorized bisection over the full array instead of a scalar solver
+    called in a Python loop over bins.
+
+    Parameters
+    ----------
+    n_off : `~numpy.ndarray`
+        Measured counts in the off region.
+    alpha : `~numpy.ndarray`
+        Acceptance ratio of on and off measurements.
+    significance : float
+        Significance to match.
+    niter : int, optional
+        Number of bisection iterations. Default is 40.
+
+    Returns
+    -------
+    n_sig : `~numpy.ndarray`
+        Excess matching the significance. NaN where no root was bracketed.
+    """
+    from gammapy.stats import wstat
+
+    if is_numba_available():
+        from gammapy.stats.fit_statistics_jit import n_sig_matching_significance_jit
+
+        n_off, alpha = np.broadcast_arrays(n_off, alpha)
+        out = np.empty(n_off.size)
+        n_sig_matching_significance_jit(
+            np.ascontiguousarray(n_off, dtype=np.float64).ravel(),
+            np.ascontiguousarray(alpha, dtype=np.float64).ravel(),
+            float(significance),
+            niter,
+            out,
+        )
+        return out.reshape(n_off.shape)
+
+    n_bkg = alpha * n_off
+
+    def fcn(n_sig):
+        stat0 = wstat(n_sig + n_bkg, n_off, alpha, 0)
+        stat1 = wstat(n_sig + n_bkg, n_off, alpha, n_sig)
+        return np.sqrt(np.clip(stat0 - stat1, 0, None)) - significance
+
+    lower = np.zeros_like(n_bkg, dtype=float)
+    upper = 5 * significance * np.sqrt(n_bkg + 1)
+
+    # enlarge the bracket where the initial guess does not contain the root
+    for _ in range(10):
+        invalid = fcn(upper) < 0
+        if not invalid.any():
+            break
+        upper[invalid] *= 2
+
+    for _ in range(niter):
+        mid = 0.5 * (lower + upper)
+        above = fcn(mid) >= 0
+        upper = np.where(above, mid, upper)
+        lower = np.where(above, lower, mid)
+
+    return np.where(fcn(upper) >= 0, 0.5 * (lower + upper), np.nan)
+
 
 class SensitivityEstimator(Estimator):
     """Estimate sensitivity.
@@ -49,6 +114,8 @@ class SensitivityEstimator(Estimator):
         bkg_syst_fraction=0.05,
     ):
         if spectral_model is None:
+            from gammapy.modeling.models import PowerLawSpectralModel
+
             spectral_model = PowerLawSpectralModel(
                 index=2, amplitude="1 cm-2 s-1 TeV-1"
             )
@@ -57,6 +124,7 @@ class SensitivityEstimator(Estimator):
         self.n_sigma = n_sigma
         self.gamma_min = gamma_min
         self.bkg_syst_fraction = bkg_syst_fraction
+        self._npred_cache = {}
 
     def estimate_min_excess(self, dataset):
         """Estimate minimum excess to reach the given significance.
@@ -71,24 +139,63 @@ class SensitivityEstimator(Estimator):
         excess : `~gammapy.maps.RegionNDMap`
             Minimal excess.
         """
-        n_off = dataset.counts_off.data
-
-        stat = WStatCountsStatistic(
-            n_on=dataset.alpha.data * n_off, n_off=n_off, alpha=dataset.alpha.data
+        # bind the property-backed arrays once, dataset.alpha and
+        # dataset.background recompute on every access; work on flat
+        # contiguous 1D views and reshape only at the Map boundary
+        alpha = dataset.alpha.data.ravel()
+        n_off = dataset.counts_off.data.ravel()
+        background = dataset.background.data.ravel()
+
+        excess_counts = _excess_matching_significance(
+            n_off=n_off, alpha=alpha, significance=self.n_sigma
         )
-        excess_counts = stat.n_sig_matching_significance(self.n_sigma)
 
-        excess_counts = apply_threshold_sensitivity(
-            dataset.background.data,
-            excess_counts,
-            self.gamma_min,
-            self.bkg_syst_fraction,
-        )
+        # fused equivalent of apply_threshold_sensitivity, writing in place;
+        # skipped entirely when both thresholds are disabled
+        if self.gamma_min:
+            np.maximum(excess_counts, self.gamma_min, out=excess_counts)
+        if self.bkg_syst_fraction:
+            np.maximum(
+                excess_counts,
+                background * self.bkg_syst_fraction,
+                out=excess_counts,
+            )
+
+        from gammapy.maps import Map
 
-        excess = Map.from_geom(geom=dataset._geom, data=excess_counts)
+        excess = Map.from_geom(
+            geom=dataset._geom,
+            data=excess_counts.reshape(dataset._geom.data_shape),
+        )
         return excess
 
-    def estimate_min_e2dnde(self, excess, dataset):
+    def _npred_signal(self, dataset):
+        """Predicted signal counts for the assumed spectral model.
+
+        The result is cached per dataset and spectral model parameters, so
+        repeated sensitivity scans on the same dataset skip the exposure and
+        energy dispersion folding. The dataset models are restored afterwards.
+        """
+        key = tuple(self.spectral_model.parameters.value)
+
+        # the dataset itself is held in the cache entry, so a freed dataset
+        # whose address gets reused can never alias a stale prediction
+        if self._npred_cache.get("dataset") is not dataset or (
+            self._npred_cache.get("key") != key
+        ):
+            from gammapy.modeling.models import SkyModel
+
+            models = dataset.models
+            dataset.models = SkyModel(spectral_model=self.spectral_model)
+            try:
+                npred = dataset.npred_signal()
+            finally:
+                dataset.models = models
+            self._npred_cache = {"dataset": dataset, "key": key, "npred": npred}
+
+        return self._npred_cache["npred"]
+
+    def estimate_min_e2dnde(self, excess, dataset, dnde_model=None):
         """Estimate e2dnde from a given minimum excess.
 
         Parameters
@@ -97,6 +204,9 @@ class SensitivityEstimator(Estimator):
             Minimal excess.
         dataset : `~gammapy.datasets.SpectrumDataset`
             Spectrum dataset.
+        dnde_model : `~astropy.units.Quantity`, optional
+            Spectral model evaluated on the reconstructed energy axis.
+            Computed from ``spectral_model`` if not given.
 
         Returns
         -------
@@ -105,25 +215,20 @@ class SensitivityEstimator(Estimator):
         """
         energy = dataset._geom.axes["energy"].center
 
-        dataset.models = SkyModel(spectral_model=self.spectral_model)
-        npred = dataset.npred_signal()
+        npred = self._npred_signal(dataset)
 
-        phi_0 = excess / npred
+        phi_0 = excess.data.ravel() / npred.data.ravel()
 
-        dnde_model = self.spectral_model(energy=energy)
-        e2dnde = phi_0.data[:, 0, 0] * dnde_model * energy**2
+        if dnde_model is None:
+            dnde_model = self.spectral_model(energy=energy)
+        e2dnde = phi_0 * dnde_model * energy**2
         return e2dnde.to("erg / (cm2 s)")
 
     def _get_criterion(self, excess, bkg):
-        is_gamma_limited = excess == self.gamma_min
-        is_bkg_syst_limited = excess == bkg * self.bkg_syst_fraction
-        criterion = np.empty(excess.shape, dtype="U12")
-        criterion[is_gamma_limited] = "gamma"
-        criterion[is_bkg_syst_limited] = "bkg"
-        criterion[~np.logical_or(is_gamma_limited, is_bkg_syst_limited)] = (
-            "significance"
-        )
-        return criterion
+        codes = np.zeros(excess.shape, dtype=np.int8)
+        codes[excess == self.gamma_min] = 1
+        codes[excess == bkg * self.bkg_syst_fraction] = 2
+        return _CRITERION_LABELS.take(codes)
 
     def run(self, dataset):
         """Run the sensitivity estimation.
@@ -147,61 +252,49 @@ class SensitivityEstimator(Estimator):
                 * criterion : sensitivity-limiting criterion
 
         """
-        energy = dataset._geom.axes["energy"].center
+        energy_axis = dataset._geom.axes["energy"]
+        energy = energy_axis.center
+
+        dnde_model = self.spectral_model(energy)
 
-        if np.any(self.spectral_model(energy).value < 0.0):
+        if np.any(dnde_model.value < 0.0):
             log.warning(
                 "Spectral model predicts negative flux. Results of estimator should be interpreted with caution"
             )
 
         excess = self.estimate_min_excess(dataset)
-        e2dnde = self.estimate_min_e2dnde(excess, dataset)
-        criterion = self._get_criterion(
-            excess.data.squeeze(), dataset.background.data.squeeze()
+        e2dnde = self.estimate_min_e2dnde(excess, dataset, dnde_model=dnde_model)
+
+        excess_1d = excess.data.reshape(-1)
+        background_1d = dataset.background.data.reshape(-1)
+        criterion = self._get_criterion(excess_1d, background_1d)
+
+        from astropy.table import Table
+
+        table = Table(
+            {
+                "e_ref": energy,
+                "e_min": energy_axis.edges_min,
+                "e_max": energy_axis.edges_max,
+                "e2dnde": e2dnde,
+                "excess": excess_1d,
+                "background": background_1d,
+                "criterion": criterion,
+            },
+            copy=False,
         )
 
-        return Table(
-            [
-                Column(
-                    data=energy,
-                    name="e_ref",
-                    format="5g",
-                    description="Energy center",
-                ),
-                Column(
-                    data=dataset._geom.axes["energy"].edges_min,
-                    name="e_min",
-                    format="5g",
-                    description="Energy edge low",
-                ),
-                Column(
-                    data=dataset._geom.axes["energy"].edges_max,
-                    name="e_max",
-                    format="5g",
-                    description="Energy edge high",
-                ),
-                Column(
-                    data=e2dnde,
-                    name="e2dnde",
-                    format="5g",
-                    description="Energy squared times differential flux",
-                ),
-                Column(
-                    data=np.atleast_1d(excess.data.squeeze()),
-                    name="excess",
-                    format="5g",
-                    description="Number of excess counts in the bin",
-                ),
-                Column(
-                    data=np.atleast_1d(dataset.background.data.squeeze()),
-                    name="background",
-                    format="5g",
-                    description="Number of background counts in the bin",
-                ),
-                Column(
-                    data=np.atleast_1d(criterion),
-                    name="criterion",
-                    description="Sensitivity-limiting criterion",
-                ),
-            ]
-        )
+        meta = [
+            ("e_ref", "5g", "Energy center"),
+            ("e_min", "5g", "Energy edge low"),
+            ("e_max", "5g", "Energy edge high"),
+            ("e2dnde", "5g", "Energy squared times differential flux"),
+            ("excess", "5g", "Number of excess counts in the bin"),
+            ("background", "5g", "Number of background counts in the bin"),
+            ("criterion", None, "Sensitivity-limiting criterion"),
+        ]
+        for name, fmt, description in meta:
+            table[name].format = fmt
+            table[name].description = description
+
+        return table
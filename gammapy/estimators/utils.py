@@ -22,6 +22,7 @@ from gammapy.stats import (
     discrete_correlation,
 )
 from gammapy.stats.utils import ts_to_sigma
+from gammapy.utils.compilation import is_numba_available
 from .map.core import FluxMaps
 import logging
 
@@ -44,6 +45,39 @@ __all__ = [
 ]
 
 
+_neighborhood_max_3x3_jit = None
+
+
+def _get_neighborhood_max_3x3_jit():
+    """Build (once) the jitted 3x3 neighborhood maximum used by `find_peaks`."""
+    global _neighborhood_max_3x3_jit
+
+    if _neighborhood_max_3x3_jit is None:
+        from numba import njit, prange
+
+        @njit("f8[:,:](f8[:,:])", parallel=True, nogil=True, cache=True)
+        def neighborhood_max_3x3(data):
+            ny, nx = data.shape
+            out = np.empty((ny, nx))
+            for i in prange(ny):
+                for j in range(nx):
+                    # constant boundary mode: out-of-bounds counts as zero
+                    if i == 0 or j == 0 or i == ny - 1 or j == nx - 1:
+                        maximum = 0.0
+                    else:
+                        maximum = -np.inf
+                    for ii in range(max(0, i - 1), min(ny, i + 2)):
+                        for jj in range(max(0, j - 1), min(nx, j + 2)):
+                            if data[ii, jj] > maximum:
+                                maximum = data[ii, jj]
+                    out[i, j] = maximum
+            return out
+
+        _neighborhood_max_3x3_jit = neighborhood_max_3x3
+
+    return _neighborhood_max_3x3_jit
+
+
 def find_peaks(image, threshold, min_distance=1):
     """Find local peaks in an image.
 
@@ -113,21 +147,38 @@ def find_peaks(image, threshold, min_distance=1):
         min_distance = np.mean(u.Quantity(min_distance) / image.geom.pixel_scales)
         min_distance = np.round(min_distance).to_value("")
 
-    size = 2 * min_distance + 1
+    # the 1D filters require an integer size, unlike the old 2D filter
+    # which silently accepted the float coming from a quantity min_distance
+    size = int(2 * min_distance + 1)
 
     # Remove non-finite values to avoid warnings or spurious detection
     data = image.sum_over_axes(keepdims=False).data
     data[~np.isfinite(data)] = np.nanmin(data)
 
     # Handle edge case of constant data; treat as no peak
-    if np.all(data == data.flat[0]):
+    if data.size == 0 or np.ptp(data) == 0:
+        return Table()
+
+    # No pixel above the threshold; skip the filter pass entirely
+    if np.max(data) <= np.min(threshold):
         return Table()
 
-    # Run peak finder
-    data_max = scipy.ndimage.maximum_filter(data, size=size, mode="constant")
-    mask = (data == data_max) & (data > threshold)
-    y, x = mask.nonzero()
-    value = data[y, x]
+    # Run peak finder; the maximum filter over a square box is separable,
+    # so two 1D passes replace the O(size^2) dense footprint, and the common
+    # min_distance=1 case gets a dedicated single-sweep 3x3 kernel
+    if size == 3 and is_numba_available():
+        neighborhood_max_3x3 = _get_neighborhood_max_3x3_jit()
+        data_max = neighborhood_max_3x3(np.ascontiguousarray(data, dtype=np.float64))
+    else:
+        data_max = scipy.ndimage.maximum_filter1d(
+            data, size=size, axis=0, mode="constant"
+        )
+        data_max = scipy.ndimage.maximum_filter1d(
+            data_max, size=size, axis=1, mode="constant"
+        )
+    idx = np.flatnonzero((data == data_max) & (data > threshold))
+    y, x = np.unravel_index(idx, data.shape)
+    value = data.ravel()[idx]
 
     # Make and return results table
 
@@ -1,15 +1,55 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import functools
 import numpy as np
 import astropy.units as u
 from astropy.visualization import quantity_support
 import matplotlib.pyplot as plt
 from gammapy.maps import MapAxes, MapAxis
 from gammapy.maps.axes import UNIT_STRING_FORMAT
+from gammapy.utils.compilation import is_numba_available
 from gammapy.visualization.utils import add_colorbar
 from .core import IRF
 
 __all__ = ["EffectiveAreaTable2D"]
 
+_aeff_param_jit = None
+
+
+def _get_aeff_param_jit():
+    """Build (once) the jitted parametrized effective area kernel."""
+    global _aeff_param_jit
+
+    if _aeff_param_jit is None:
+        from numba import njit
+
+        @njit("f8[:](f8[:],f8,f8,f8)", fastmath=True, nogil=True, cache=True)
+        def aeff_param(energy, g1, g2, g3):
+            out = np.empty_like(energy)
+            for i in range(energy.shape[0]):
+                # g1 * E**(-g2) * exp(-g3 / E) fused into a single exp
+                out[i] = g1 * np.exp(-g2 * np.log(energy[i]) - g3 / energy[i])
+            return out
+
+        _aeff_param_jit = aeff_param
+
+    return _aeff_param_jit
+
+
+@functools.lru_cache(maxsize=32)
+def _evaluate_aeff_parametrization(energy_bytes, shape, g1, g2, g3):
+    """Evaluate the analytic Aeff parametrization, memoized on its inputs.
+
+    The energy grid is passed as raw bytes so repeated calls with the same
+    energy axis and instrument reuse the cached evaluation.
+    """
+    energy = np.frombuffer(energy_bytes).reshape(shape)
+
+    if is_numba_available():
+        aeff_param = _get_aeff_param_jit()
+        return aeff_param(energy.ravel().copy(), g1, g2, g3).reshape(shape)
+
+    return g1 * energy ** (-g2) * np.exp(-g3 / energy)
+
 
 class EffectiveAreaTable2D(IRF):
     """2D effective area table.
@@ -101,10 +141,14 @@ class EffectiveAreaTable2D(IRF):
         energy_axis = self.axes["energy_true"]
 
         with quantity_support():
-            for off in offset:
-                area = self.evaluate(offset=off, energy_true=energy_axis.center)
+            # evaluate all curves with a single broadcast interpolation
+            offset_grid, energy_grid = np.broadcast_arrays(
+                offset[:, np.newaxis], energy_axis.center[np.newaxis, :], subok=True
+            )
+            area = self.evaluate(offset=offset_grid, energy_true=energy_grid)
+            for off, area_off in zip(offset, area):
                 label = kwargs.pop("label", f"offset = {off:.1f}")
-                ax.plot(energy_axis.center, area, label=label, **kwargs)
+                ax.plot(energy_axis.center, area_off, label=label, **kwargs)
 
         energy_axis.format_plot_xaxis(ax=ax)
         ax.set_ylabel(
@@ -140,16 +184,20 @@ class EffectiveAreaTable2D(IRF):
         offset_axis = self.axes["offset"]
 
         with quantity_support():
-            for ee in energy:
-                area = self.evaluate(offset=offset_axis.center, energy_true=ee)
-                max_area = np.nanmax(area)
+            # evaluate all curves with a single broadcast interpolation
+            offset_grid, energy_grid = np.broadcast_arrays(
+                offset_axis.center[np.newaxis, :], energy[:, np.newaxis], subok=True
+            )
+            area = self.evaluate(offset=offset_grid, energy_true=energy_grid)
+            for ee, area_energy in zip(energy, area):
+                max_area = np.nanmax(area_energy)
                 if max_area == 0:
                     continue
-                area /= max_area
-                if np.isnan(area).all():
+                area_energy = area_energy / max_area
+                if np.isnan(area_energy).all():
                     continue
                 label = f"energy = {ee:.1f}"
-                ax.plot(offset_axis.center, area, label=label, **kwargs)
+                ax.plot(offset_axis.center, area_energy, label=label, **kwargs)
 
         offset_axis.format_plot_xaxis(ax=ax)
         ax.set_ylim(0, 1.1)
@@ -285,7 +333,13 @@ class EffectiveAreaTable2D(IRF):
         coords = axes.get_coord()
 
         energy, offset = coords["energy_true"].to_value("MeV"), coords["offset"]
-        data = np.ones_like(offset.value) * g1 * energy ** (-g2) * np.exp(-g3 / energy)
+
+        energy = np.ascontiguousarray(energy, dtype=np.float64)
+        values = _evaluate_aeff_parametrization(
+            energy.tobytes(), energy.shape, g1, g2, g3
+        )
+
+        data = np.ones_like(offset.value) * values
 
         # TODO: fake offset dependence?
         meta = {"TELESCOP": instrument}
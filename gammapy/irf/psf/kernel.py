@@ -57,9 +57,9 @@ class PSFKernel:
 
     def __init__(self, psf_kernel_map, normalize=True):
         self._psf_kernel_map = psf_kernel_map
-
-        if normalize:
-            self.normalize()
+        # normalisation is deferred to the first access of the kernel data,
+        # so kernels that are sliced or discarded right away do not pay for it
+        self._needs_normalize = normalize
 
     def _repr_html_(self):
         try:
@@ -69,24 +69,34 @@ class PSFKernel:
 
     def normalize(self):
         """Force normalisation of the kernel."""
-        data = self.psf_kernel_map.data
-        if self.psf_kernel_map.geom.is_image:
+        self._needs_normalize = False
+        data = self._psf_kernel_map.data
+        if self._psf_kernel_map.geom.is_image:
             axis = (0, 1)
         else:
             axis = (1, 2)
 
-        with np.errstate(divide="ignore", invalid="ignore"):
-            data = np.nan_to_num(data / data.sum(axis=axis, keepdims=True))
-            self.psf_kernel_map.data = data
+        # fused divide writing zeros where the normalisation sum vanishes,
+        # avoiding the intermediate quotient cube; the in-place nan_to_num
+        # still sweeps non-finite kernel values as before
+        norm = data.sum(axis=axis, keepdims=True)
+        out = np.zeros_like(data, dtype=float)
+        np.divide(data, norm, out=out, where=norm != 0)
+        np.nan_to_num(out, copy=False)
+        self._psf_kernel_map.data = out
 
     @property
     def data(self):
         """Access the PSFKernel numpy array."""
+        if self._needs_normalize:
+            self.normalize()
         return self._psf_kernel_map.data
 
     @property
     def psf_kernel_map(self):
         """The map object holding the kernel as a `~gammapy.maps.Map`."""
+        if self._needs_normalize:
+            self.normalize()
         return self._psf_kernel_map
 
     @classmethod
@@ -197,20 +207,30 @@ class PSFKernel:
             raise ValueError("Incorrect exposure_array shape")
 
         # Compute weights vector
-        for name in map.geom.axes.names:
-            if "energy" in name:
-                energy_name = name
+        energy_name = next(name for name in map.geom.axes.names if "energy" in name)
         energy_edges = map.geom.axes[energy_name].edges
-        weights = spectral_model.integral(
-            energy_min=energy_edges[:-1], energy_max=energy_edges[1:], intervals=True
+        # drop to raw arrays early, the units cancel in the normalisation
+        weights = (
+            spectral_model.integral(
+                energy_min=energy_edges[:-1],
+                energy_max=energy_edges[1:],
+                intervals=True,
+            ).value
+            * exposure.value
         )
-        weights *= exposure
         weights /= weights.sum()
 
-        spectrum_weighted_kernel = map.copy()
-        spectrum_weighted_kernel.quantity *= weights[:, np.newaxis, np.newaxis]
+        # weighted sum over energy in one reduction, without copying the cube
+        data = np.einsum("i,ijk->jk", weights, map.data)
+
+        if keepdims:
+            geom = map.geom.squash(axis_name=energy_name)
+            data = data[np.newaxis, :, :]
+        else:
+            geom = map.geom.to_image()
 
-        return self.__class__(spectrum_weighted_kernel.sum_over_axes(keepdims=keepdims))
+        kernel_map = Map.from_geom(geom=geom, data=data, unit=map.unit)
+        return self.__class__(kernel_map)
 
     def slice_by_idx(self, slices):
         """Slice by index."""
@@ -39,6 +39,11 @@ class Likelihood:
         self.trace.append(row)
 
     def fcn(self, factors):
+        # Note: this objective cannot be lowered to a `numba.cfunc` /
+        # `scipy.LowLevelCallable`: it closes over the Parameters container
+        # and an arbitrary dataset callable, both Python objects. The
+        # compiled fast path lives in the fit-statistics kernels instead
+        # (see `gammapy.utils.compilation`).
         self.parameters.set_parameter_factors(factors)
         total_stat = self.function()
 
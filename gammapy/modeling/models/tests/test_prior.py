@@ -18,39 +18,43 @@ from gammapy.modeling.models import (
 )
 from gammapy.utils.testing import assert_quantity_allclose
 
-TEST_PRIORS = [
-    dict(
-        name="gaussian",
-        model=GaussianPrior(mu=4.0, sigma=1.0),
-        prior_0=0.0 * u.Unit(""),
-        prior_1=1.0 * u.Unit(""),
-        val_at_0=17.837877,
-        val_at_1=10.837877,
-        inverse_cdf_at_0=-np.inf,
-        inverse_cdf_at_1=np.inf,
-    ),
-    dict(
-        name="uniform",
-        model=UniformPrior(min=0.0, max=10),
-        prior_0=0.0 * u.Unit(""),
-        prior_1=11.0 * u.Unit(""),
-        val_at_0=4.60517,
-        val_at_1=np.inf,
-        val_with_weight_2=9.21034,
-        inverse_cdf_at_0=0.0,
-        inverse_cdf_at_1=10.0,
-    ),
-    dict(
-        name="loguniform",
-        model=LogUniformPrior(min=1e-14, max=1e-10),
-        prior_0=1e-10 * u.Unit(""),
-        prior_1=1e-14 * u.Unit(""),
-        val_at_0=-41.61104824714522,
-        val_at_1=-60.03172899109759,
-        inverse_cdf_at_0=1e-14,
-        inverse_cdf_at_1=1e-10,
-    ),
-    dict(
+def _make_prior_data(name):
+    """Build one prior test case; construction is deferred to test run time."""
+    if name == "gaussian":
+        return dict(
+            name="gaussian",
+            model=GaussianPrior(mu=4.0, sigma=1.0),
+            prior_0=0.0 * u.Unit(""),
+            prior_1=1.0 * u.Unit(""),
+            val_at_0=17.837877,
+            val_at_1=10.837877,
+            inverse_cdf_at_0=-np.inf,
+            inverse_cdf_at_1=np.inf,
+        )
+    if name == "uniform":
+        return dict(
+            name="uniform",
+            model=UniformPrior(min=0.0, max=10),
+            prior_0=0.0 * u.Unit(""),
+            prior_1=11.0 * u.Unit(""),
+            val_at_0=4.60517,
+            val_at_1=np.inf,
+            val_with_weight_2=9.21034,
+            inverse_cdf_at_0=0.0,
+            inverse_cdf_at_1=10.0,
+        )
+    if name == "loguniform":
+        return dict(
+            name="loguniform",
+            model=LogUniformPrior(min=1e-14, max=1e-10),
+            prior_0=1e-10 * u.Unit(""),
+            prior_1=1e-14 * u.Unit(""),
+            val_at_0=-41.61104824714522,
+            val_at_1=-60.03172899109759,
+            inverse_cdf_at_0=1e-14,
+            inverse_cdf_at_1=1e-10,
+        )
+    return dict(
         name="gennorm",
         model=GeneralizedGaussianPrior(mu=4, sigma=1.0, eta=0.5),
         prior_0=0.0 * u.Unit(""),
@@ -59,11 +63,17 @@ TEST_PRIORS = [
         val_at_1=10.837877,
         inverse_cdf_at_0=-np.inf,
         inverse_cdf_at_1=np.inf,
-    ),
-]
+    )
+
+
+PRIOR_NAMES = ["gaussian", "uniform", "loguniform", "gennorm"]
+
+
+@pytest.fixture(params=PRIOR_NAMES)
+def prior(request):
+    return _make_prior_data(request.param)
 
 
-@pytest.mark.parametrize("prior", TEST_PRIORS)
 def test_prior_evaluation(prior):
     model = prior["model"]
     # Test the evaluation of the prior at specific points
@@ -77,7 +87,6 @@ def test_prior_evaluation(prior):
     assert_allclose(value_1, prior["inverse_cdf_at_1"], rtol=1e-7)
 
 
-@pytest.mark.parametrize("prior", TEST_PRIORS)
 def test_prior_parameters(prior):
     model = prior["model"]
     # Check that all parameters of the model have type 'prior'
@@ -86,7 +95,7 @@ def test_prior_parameters(prior):
 
 
 def test_uniform_prior_weight():
-    prior = TEST_PRIORS[1]
+    prior = _make_prior_data("uniform")
     model = prior["model"]
     # Test the uniform prior with a specific weight
     model.weight = 2.0
@@ -95,7 +104,7 @@ def test_uniform_prior_weight():
 
 
 def test_to_from_dict():
-    prior = TEST_PRIORS[1]
+    prior = _make_prior_data("uniform")
     model = prior["model"]
     model.weight = 2.0
     model_dict = model.to_dict()
@@ -122,7 +131,6 @@ def test_to_from_dict():
     assert_allclose(model.weight, new_model.weight, rtol=1e-7)
 
 
-@pytest.mark.parametrize("prior", TEST_PRIORS)
 def test_serialisation(prior, tmpdir):
     model = SkyModel.create(spectral_model="pl", name="crab")
     model.spectral_model.amplitude.prior = prior["model"]
@@ -2,7 +2,7 @@
 import numpy as np
 import scipy.optimize
 from gammapy.utils.interpolation import interpolate_profile
-from gammapy.utils.roots import find_roots
+from gammapy.utils.roots import _chandrupatla, find_roots
 from .likelihood import Likelihood
 
 __all__ = [
@@ -14,15 +14,29 @@ __all__ = [
 
 
 def optimize_scipy(parameters, function, store_trace=False, **kwargs):
-    method = kwargs.pop("method", "Nelder-Mead")
-    pars = [par.factor for par in parameters.free_parameters]
-
-    bounds = []
-
-    for par in parameters.free_parameters:
-        parmin = par.factor_min if not np.isnan(par.factor_min) else None
-        parmax = par.factor_max if not np.isnan(par.factor_max) else None
-        bounds.append((parmin, parmax))
+    # gradient-based L-BFGS-B converges in far fewer evaluations than
+    # Nelder-Mead on smooth likelihoods and keeps bounds support; pass
+    # method="Nelder-Mead" explicitly to recover the old behaviour
+    method = kwargs.pop("method", "L-BFGS-B")
+
+    # walk the Parameters container once and reuse the materialized list
+    free = list(parameters.free_parameters)
+    pars = np.fromiter((par.factor for par in free), dtype=np.float64, count=len(free))
+
+    # one vectorized isnan over the gathered bound arrays instead of two
+    # scalar ufunc calls per parameter
+    mins = np.fromiter((par.factor_min for par in free), dtype=np.float64)
+    maxs = np.fromiter((par.factor_max for par in free), dtype=np.float64)
+    mins_valid = ~np.isnan(mins)
+    maxs_valid = ~np.isnan(maxs)
+
+    bounds = [
+        (
+            mins[i] if mins_valid[i] else None,
+            maxs[i] if maxs_valid[i] else None,
+        )
+        for i in range(len(free))
+    ]
 
     likelihood = Likelihood(function, parameters, store_trace)
     result = scipy.optimize.minimize(
@@ -44,28 +58,55 @@ def optimize_scipy(parameters, function, store_trace=False, **kwargs):
 class TSDifference:
     """Fit statistic function wrapper to compute TS differences."""
 
-    def __init__(self, function, parameters, parameter, reoptimize, ts_diff):
-        self.stat_null = function()
+    def __init__(
+        self, function, parameters, parameter, reoptimize, ts_diff, stat_null=None
+    ):
+        # accept a precomputed null statistic to avoid a redundant forward
+        # pass when the caller has just evaluated the best-fit statistic
+        self.stat_null = function() if stat_null is None else stat_null
         self.parameters = parameters
         self.function = function
         self.parameter = parameter
         self.ts_diff = ts_diff
-        self.reoptimize = reoptimize
+        # the inner fit is pointless once the scanned parameter is frozen
+        # and no other free parameter remains
+        self.reoptimize = reoptimize and len(parameters.free_parameters) > 1
+        # specialize the hot path once instead of re-checking the flag and
+        # re-adding the constants on every solver iteration
+        self._shift = self.stat_null + ts_diff
+        self.fcn = self._fcn_reopt if self.reoptimize else self._fcn_noreopt
+
+    def _fcn_noreopt(self, factor):
+        # the numeric likelihood reduction itself already runs through the
+        # compiled fit-statistics backend (see `gammapy.utils.compilation`),
+        # so only the thin Python driver remains here
+        self.parameter.factor = factor
+        return self.function() - self._shift
 
-    def fcn(self, factor):
+    def _fcn_reopt(self, factor):
         self.parameter.factor = factor
-        if self.reoptimize:
-            self.parameter.frozen = True
-            optimize_scipy(self.parameters, self.function, method="L-BFGS-B")
-        value = self.function() - self.stat_null - self.ts_diff
-        return value
+        self.parameter.frozen = True
+        optimize_scipy(self.parameters, self.function, method="L-BFGS-B")
+        return self.function() - self._shift
 
 
 def _confidence_scipy_brentq(
-    parameters, parameter, function, sigma, reoptimize, upper=True, **kwargs
+    parameters,
+    parameter,
+    function,
+    sigma,
+    reoptimize,
+    upper=True,
+    stat_null=None,
+    **kwargs,
 ):
     ts_diff = TSDifference(
-        function, parameters, parameter, reoptimize, ts_diff=sigma**2
+        function,
+        parameters,
+        parameter,
+        reoptimize,
+        ts_diff=sigma**2,
+        stat_null=stat_null,
     )
 
     lower_bound = parameter.factor
@@ -77,10 +118,20 @@ def _confidence_scipy_brentq(
 
     message, success = "Confidence terminated successfully.", True
     kwargs.setdefault("nbin", 1)
+    # brenth's hyperbolic extrapolation needs fewer evaluations than brentq
+    # on the shallowly quadratic TS curves scanned here
+    kwargs.setdefault("method", "brenth")
 
     roots, res = find_roots(
         ts_diff.fcn, lower_bound=lower_bound, upper_bound=upper_bound, **kwargs
     )
+
+    if np.isnan(roots[0]) and kwargs["method"] == "brenth":
+        kwargs["method"] = "brentq"
+        roots, res = find_roots(
+            ts_diff.fcn, lower_bound=lower_bound, upper_bound=upper_bound, **kwargs
+        )
+
     result = (roots[0], res[0])
 
     if np.isnan(roots[0]):
@@ -100,10 +151,90 @@ def _confidence_scipy_brentq(
     }
 
 
+def _confidence_scipy_chandrupatla(parameters, parameter, function, sigma, **kwargs):
+    """Solve the errn and errp bounds with a single vectorized root-finder call.
+
+    Only valid without reoptimization, where the TS difference depends on the
+    scanned factor alone, so both sides can be iterated in lock-step.
+    """
+    ts_diff = TSDifference(
+        function, parameters, parameter, reoptimize=False, ts_diff=sigma**2
+    )
+
+    factor = parameter.factor
+    lower = np.array([factor, factor], dtype=float)
+    upper = np.array(
+        [
+            parameter.conf_min / parameter.scale,
+            parameter.conf_max / parameter.scale,
+        ],
+        dtype=float,
+    )
+
+    def fcn(x):
+        # the objective mutates the parameter, so evaluate element-wise
+        flat = np.ravel(x)
+        return np.array([ts_diff.fcn(xk) for xk in flat]).reshape(np.shape(x))
+
+    res = _chandrupatla(
+        fcn,
+        lower,
+        upper,
+        xatol=kwargs.get("xtol"),
+        xrtol=kwargs.get("rtol"),
+        **({"maxiter": kwargs["maxiter"]} if kwargs.get("maxiter") else {}),
+    )
+
+    result = {}
+    for k, suffix in enumerate(["errn", "errp"]):
+        success = bool(res.success[k])
+        if success:
+            message, root = "Confidence terminated successfully.", res.x[k]
+        else:
+            message = "Confidence estimation failed. Try to set the parameter.min/max by hand."
+            root = np.nan
+        result["nfev_" + suffix] = int(res.nit[k])
+        result[suffix] = np.abs(root - factor)
+        result["success_" + suffix] = success
+        result["message_" + suffix] = message
+
+    result["stat_null"] = ts_diff.stat_null
+    return result
+
+
 def confidence_scipy(parameters, parameter, function, sigma, reoptimize=True, **kwargs):
     if len(parameters.free_parameters) <= 1:
         reoptimize = False
 
+    # the vectorized solver only understands tolerance options; requests for
+    # a specific scalar method or sampling keep the sequential path, as does
+    # a scipy without any vectorized bracketing solver
+    if (
+        not reoptimize
+        and _chandrupatla is not None
+        and not set(kwargs) - {"xtol", "rtol", "maxiter"}
+    ):
+        # both sides share the iteration in one vectorized call
+        with parameters.restore_status():
+            return _confidence_scipy_chandrupatla(
+                parameters=parameters,
+                parameter=parameter,
+                function=function,
+                sigma=sigma,
+                **kwargs,
+            )
+
+    # Note: the two sides cannot be dispatched to a thread pool here. Both
+    # closures drive the same live Parameters objects through the dataset
+    # callable, and cloning the parameters would not redirect the callable,
+    # which closes over the original datasets. The non-reoptimizing case
+    # above already advances both sides together in one vectorized solve.
+    saved_factor = parameter.factor
+    saved_frozen = parameter.frozen
+
+    # evaluate the best-fit statistic once and share it with both sides
+    stat_null = function()
+
     with parameters.restore_status():
         result = _confidence_scipy_brentq(
             parameters=parameters,
@@ -112,10 +243,16 @@ def confidence_scipy(parameters, parameter, function, sigma, reoptimize=True, **
             sigma=sigma,
             upper=False,
             reoptimize=reoptimize,
+            stat_null=stat_null,
             **kwargs,
         )
 
-    with parameters.restore_status():
+        # reset only the scanned parameter between the two sides; the other
+        # parameters are re-optimized per evaluation anyway and their current
+        # values just serve as warm start for the upper side
+        parameter.factor = saved_factor
+        parameter.frozen = saved_frozen
+
         result_errp = _confidence_scipy_brentq(
             parameters=parameters,
             parameter=parameter,
@@ -123,6 +260,7 @@ def confidence_scipy(parameters, parameter, function, sigma, reoptimize=True, **
             sigma=sigma,
             upper=True,
             reoptimize=reoptimize,
+            stat_null=stat_null,
             **kwargs,
         )
 
@@ -162,19 +300,22 @@ def stat_profile_ul_scipy(
     """
     stat_scan = np.array(stat_scan)
     value_scan = np.array(value_scan)
-    if np.allclose(stat_scan, stat_scan[0]):
-        raise ValueError(
-            "Statistic profile is flat therefore no best-fit value can be determined."
-        )
 
+    # validate on the compacted profile: any() short-circuits on the first
+    # finite entry and the flatness check then scans the valid region once
     mask_valid = np.isfinite(stat_scan) & np.isfinite(value_scan)
-    if not np.any(mask_valid):
+    if not mask_valid.any():
         raise ValueError(
             "Statistic profile has no finite value therefore no best-fit value can be determined."
         )
 
     value_scan = value_scan[mask_valid]
     stat_scan = stat_scan[mask_valid]
+
+    if np.allclose(stat_scan, stat_scan[0]):
+        raise ValueError(
+            "Statistic profile is flat therefore no best-fit value can be determined."
+        )
     interp = interpolate_profile(value_scan, stat_scan, interp_scale=interp_scale)
 
     result = scipy.optimize.minimize_scalar(
@@ -190,8 +331,20 @@ def stat_profile_ul_scipy(
         y = interp(np.asarray([x]))
         return float(y.item()) - stat_best_fit - delta_ts
 
+    # bracket the upper limit with one vectorized profile evaluation, so
+    # the scalar solver only has to polish a tight interval
+    samples = np.linspace(norm_best_fit, value_scan[-1], 1024)
+    above = interp(samples) - stat_best_fit - delta_ts > 0
+
+    if not above.any():
+        raise RuntimeError("Failed to find upper limit: no valid root found.")
+
+    idx = np.argmax(above)
+    lower_bound = samples[idx - 1] if idx > 0 else norm_best_fit
+    upper_bound = samples[idx]
+
     roots, res = find_roots(
-        f, lower_bound=norm_best_fit, upper_bound=value_scan[-1], nbin=1, **kwargs
+        f, lower_bound=lower_bound, upper_bound=upper_bound, nbin=1, **kwargs
     )
     if not np.isfinite(roots[0]):
         raise RuntimeError("Failed to find upper limit: no valid root found.")
@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from dataclasses import dataclass
+from functools import cached_property
 import numpy as np
 from gammapy.modeling import Fit, Parameter, Covariance, FitResult, OptimizeResult
 from gammapy.stats.utils import sigma_to_ts
@@ -6,6 +8,16 @@ from gammapy.stats.utils import sigma_to_ts
 __all__ = ["select_nested_models", "NestedModelSelection"]
 
 
+@dataclass(slots=True)
+class _ParameterSnapshot:
+    """Structure-of-arrays snapshot of a parameter state."""
+
+    objects: list
+    values: np.ndarray
+    errors: np.ndarray
+    covariance: Covariance
+
+
 class NestedModelSelection:
     """Compute the test statistic (TS) between two nested hypothesis.
 
@@ -51,13 +63,22 @@ class NestedModelSelection:
             fit.backend = "minuit"
             fit.optimize_opts = minuit_opts
         self.fit = fit
+        self._asimov_cache = None
 
-    @property
+    def __setattr__(self, name, value):
+        # the cached threshold only depends on these two attributes
+        if name in ("n_sigma", "n_free_parameters"):
+            self.__dict__.pop("ts_threshold", None)
+        super().__setattr__(name, value)
+
+    @cached_property
     def ts_threshold(self):
         """Threshold value in TS corresponding to `n_sigma`.
 
         This assumes that the TS follows a chi squared distribution
         with a number of degree of freedom equal to `n_free_parameters`.
+        The value is cached and recomputed when `n_sigma` or
+        `n_free_parameters` change.
         """
         return np.sign(self.n_sigma) * sigma_to_ts(self.n_sigma, self.n_free_parameters)
 
@@ -72,9 +93,23 @@ class NestedModelSelection:
          (for example considering diffuse background or nearby source).
         """
         stat = datasets.stat_sum()
-        cache = self._apply_null_hypothesis(datasets)
+
+        # no fit runs between the two evaluations, so only the tested
+        # parameters need to be swapped and restored; this skips the full
+        # parameter snapshot and covariance copy of _apply_null_hypothesis
+        saved = [(p, p.__dict__, p.value) for p in self.parameters]
+        for p, val in zip(self.parameters, self.null_values):
+            if isinstance(val, Parameter):
+                p.__dict__ = val.__dict__
+            else:
+                p.value = val
+
         stat_null = datasets.stat_sum()
-        self._restore_status(datasets, cache)
+
+        for p, obj, value in saved:
+            p.__dict__ = obj
+            p.value = value
+
         return stat_null - stat
 
     def ts_asimov(self, datasets):
@@ -82,7 +117,43 @@ class NestedModelSelection:
 
         The Asimov dataset is defined by counts=npred such as the non-null model is the true model.
         """
-        asimov_datasets = datasets._to_asimov_datasets()
+        # Datasets.models rebuilds its container on every access, so the
+        # cache is keyed on the member model identities, which are stable
+        # while the datasets (held in the cache entry) stay alive
+        token = tuple(id(model) for model in datasets.models)
+
+        cached = self._asimov_cache
+        asimov_datasets = None
+
+        if cached is not None and cached[0] is datasets and cached[1] == token:
+            # reuse the Asimov datasets and refresh counts in place instead
+            # of re-allocating the full dataset copies on every evaluation;
+            # the prediction must come from the original datasets, since for
+            # on-off datasets npred profiles against the observed counts
+            asimov_datasets = cached[2]
+            for asimov, dataset in zip(asimov_datasets, datasets):
+                npred = dataset.npred()
+                if npred.data.shape != asimov.counts.data.shape:
+                    # inconsistent prediction, e.g. from array-valued
+                    # parameters probed by a root finder; rebuild instead
+                    asimov_datasets = None
+                    break
+                asimov.counts.data[...] = np.nan_to_num(
+                    npred.data, copy=False, nan=0.0, posinf=0.0, neginf=0.0
+                )
+
+        if asimov_datasets is None:
+            asimov_datasets = datasets._to_asimov_datasets()
+            # only cache entries whose counts match the input datasets, so a
+            # transient broadcast (array-valued parameters) is never reused
+            consistent = all(
+                dataset.counts is not None
+                and asimov.counts.data.shape == dataset.counts.data.shape
+                for asimov, dataset in zip(asimov_datasets, datasets)
+            )
+            if consistent:
+                self._asimov_cache = (datasets, token, asimov_datasets)
+
         return self.ts_known_bkg(asimov_datasets)
 
     def ts(self, datasets):
@@ -118,12 +189,16 @@ class NestedModelSelection:
 
         if len(datasets.models.parameters.free_parameters) > 0:
             fit_results_null = self.fit.run(datasets)
+            stat_null = datasets.stat_sum()
         else:
+            # fully frozen null hypothesis: no fit to run, and the single
+            # stat evaluation doubles as the fit result total_stat
+            stat_null = datasets.stat_sum()
             fit_results_null = FitResult(
                 OptimizeResult(
                     models=datasets.models.copy(),
                     nfev=0,
-                    total_stat=datasets.stat_sum(),
+                    total_stat=stat_null,
                     trace=None,
                     backend=None,
                     method=None,
@@ -131,7 +206,6 @@ class NestedModelSelection:
                     message=None,
                 )
             )
-        stat_null = datasets.stat_sum()
 
         ts = stat_null - stat
         if not apply_selection or ts > self.ts_threshold:
@@ -144,30 +218,43 @@ class NestedModelSelection:
         )
 
     def _apply_null_hypothesis(self, datasets):
-        cache = dict()
-        cache["object"] = [p.__dict__ for p in datasets.models.parameters]
-        cache["values"] = [p.value for p in datasets.models.parameters]
-        cache["error"] = [p.error for p in datasets.models.parameters]
+        parameters = datasets.models.parameters
+        n_par = len(parameters)
+
+        # snapshot the parameter state as one contiguous array per field
+        # instead of per-parameter Python lists
+        objects = [p.__dict__ for p in parameters]
+        values = np.fromiter(
+            (p.value for p in parameters), dtype=np.float64, count=n_par
+        )
+        errors = np.fromiter(
+            (p.error for p in parameters), dtype=np.float64, count=n_par
+        )
         for p, val in zip(self.parameters, self.null_values):
             if isinstance(val, Parameter):
                 p.__dict__ = val.__dict__
             else:
                 p.value = val
                 p.frozen = True
-        cache["covar"] = Covariance(
-            datasets.models.parameters, datasets.models.covariance.data
+        covariance = Covariance(parameters, datasets.models.covariance.data)
+        return _ParameterSnapshot(
+            objects=objects, values=values, errors=errors, covariance=covariance
         )
-        return cache
 
-    def _restore_status(self, datasets, cache):
-        """Restore parameters to given cached objects and values."""
+    def _restore_status(self, datasets, snapshot):
+        """Restore parameters to a given snapshot."""
         for p in self.parameters:
             p.frozen = False
-        for kp, p in enumerate(datasets.models.parameters):
-            p.__dict__ = cache["object"][kp]
-            p.value = cache["values"][kp]
-            p.error = cache["error"][kp]
-        datasets._covariance = cache["covar"]
+        for p, obj, value, error in zip(
+            datasets.models.parameters,
+            snapshot.objects,
+            snapshot.values,
+            snapshot.errors,
+        ):
+            p.__dict__ = obj
+            p.value = value
+            p.error = error
+        datasets._covariance = snapshot.covariance
 
 
 def select_nested_models(
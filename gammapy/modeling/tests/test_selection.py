@@ -106,3 +106,98 @@ def test_test_statistic_link(fermi_datasets):
     assert_allclose(model2.spectral_model.alpha.value, model.spectral_model.alpha.value)
     assert_allclose(model2.spectral_model.alpha.error, model.spectral_model.alpha.error)
     assert model2.spectral_model.alpha.error != 0
+
+
+@pytest.fixture()
+def spectrum_datasets():
+    from gammapy.datasets import Datasets, SpectrumDataset
+    from gammapy.irf import EDispKernelMap
+    from gammapy.maps import MapAxis, RegionNDMap
+    from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
+
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=8, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=4)
+
+    background = RegionNDMap.create(
+        region="icrs;circle(0, 0, 0.1)", axes=[energy_axis]
+    )
+    background.data += 10
+    edisp = EDispKernelMap.from_diagonal_response(
+        energy_axis_true=energy_axis_true,
+        energy_axis=energy_axis,
+        geom=background.geom,
+    )
+    exposure = RegionNDMap.create(
+        region="icrs;circle(0, 0, 0.1)", axes=[energy_axis_true], unit="m2 h", data=1e6
+    )
+
+    dataset = SpectrumDataset(
+        name="test", exposure=exposure, edisp=edisp, background=background
+    )
+    dataset.counts = dataset.background.copy()
+    dataset.counts.data = np.random.default_rng(0).poisson(
+        dataset.background.data + 50
+    )
+
+    datasets = Datasets(dataset)
+    datasets.models = [SkyModel(spectral_model=PowerLawSpectralModel(), name="source")]
+    return datasets
+
+
+@pytest.fixture(params=["spectrum", "spectrum-onoff"])
+def asimov_datasets(request, spectrum_datasets):
+    if request.param == "spectrum":
+        return spectrum_datasets
+
+    from gammapy.datasets import Datasets, SpectrumDatasetOnOff
+    from gammapy.maps import RegionNDMap
+
+    dataset = spectrum_datasets[0]
+    geom = dataset.background.geom
+    dataset_on_off = SpectrumDatasetOnOff.from_spectrum_dataset(
+        dataset=dataset,
+        acceptance=RegionNDMap.from_geom(geom=geom, data=1),
+        acceptance_off=RegionNDMap.from_geom(geom=geom, data=5),
+    )
+    dataset_on_off.counts_off.data += 50
+    datasets = Datasets(dataset_on_off)
+    datasets.models = spectrum_datasets.models
+    return datasets
+
+
+def test_ts_asimov_cache(asimov_datasets, monkeypatch):
+    from gammapy.datasets import Datasets
+
+    spectrum_datasets = asimov_datasets
+    model = spectrum_datasets.models["source"]
+    selection = NestedModelSelection(
+        parameters=[model.spectral_model.amplitude], null_values=[0]
+    )
+
+    calls = []
+    to_asimov = Datasets._to_asimov_datasets
+
+    def counting_to_asimov(self):
+        calls.append(1)
+        return to_asimov(self)
+
+    monkeypatch.setattr(Datasets, "_to_asimov_datasets", counting_to_asimov)
+
+    ts_first = selection.ts_asimov(spectrum_datasets)
+    ts_second = selection.ts_asimov(spectrum_datasets)
+
+    # the Asimov datasets are built once and reused with refreshed counts,
+    # with the refresh reproducing a fresh build exactly (in particular for
+    # on-off datasets, where npred profiles against the observed counts)
+    assert len(calls) == 1
+    assert_allclose(ts_second, ts_first)
+    assert_allclose(
+        selection.ts_known_bkg(spectrum_datasets._to_asimov_datasets()), ts_first
+    )
+
+    # parameter changes are reflected through the in-place counts refresh
+    model.spectral_model.amplitude.value *= 2
+    ts_scaled = selection.ts_asimov(spectrum_datasets)
+    assert ts_scaled != ts_first
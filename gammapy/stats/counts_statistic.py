@@ -1,15 +1,70 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import abc
 import html
+from functools import cached_property, lru_cache
 import numpy as np
-from scipy.special import lambertw
-from scipy.stats import chi2
-from gammapy.utils.roots import find_roots
+from scipy.special import erfc, lambertw
+from gammapy.utils.roots import _chandrupatla
+from gammapy.utils.compilation import is_numba_available
 from .fit_statistics import cash, wstat
 
 __all__ = ["WStatCountsStatistic", "CashCountsStatistic"]
 
 
+# below this size the per-call thread startup of the parallel jit kernels
+# outweighs their benefit and the vectorized scipy solver is used instead
+JIT_ROOT_MIN_SIZE = 10_000
+
+
+@lru_cache(maxsize=1)
+def _jit_kernels():
+    """Import the compiled kernel module once per process.
+
+    The kernels carry explicit numba signatures with cache=True, so the
+    generated code is already specialized and persisted; this only removes
+    the repeated import-machinery lookup from the solver hot path.
+    """
+    from . import fit_statistics_jit
+
+    return fit_statistics_jit
+
+
+def _bisect_stat_roots(fcn, lower, upper, niter=80):
+    """Vectorized bisection fallback used when scipy has no vectorized solver.
+
+    Mirrors the bracket handling of the jit root kernels: bins without a sign
+    change get NaN, unless an endpoint is an exact root.
+    """
+    fa = fcn(lower)
+    fb = fcn(upper)
+    invalid = np.isnan(fa) | np.isnan(fb) | ((fa > 0) == (fb > 0))
+
+    a, b = lower.copy(), upper.copy()
+    for _ in range(niter):
+        mid = 0.5 * (a + b)
+        same_side = (fcn(mid) > 0) == (fa > 0)
+        a = np.where(same_side, mid, a)
+        b = np.where(same_side, b, mid)
+
+    roots = np.where(invalid, np.nan, 0.5 * (a + b))
+    roots = np.where(invalid & (fa == 0), lower, roots)
+    return np.where(invalid & (fa != 0) & (fb == 0), upper, roots)
+
+
+def _as_f8(array):
+    """Contiguous writable float64 view or copy, as required by the jit kernels.
+
+    The solvers deliberately stay in float64: the TS is the difference of two
+    statistics that are both large compared to it (catastrophic cancellation),
+    so float32 inputs would corrupt significances at the unit level on big
+    maps rather than just rounding the reported digits.
+    """
+    array = np.ascontiguousarray(array, dtype=np.float64)
+    if not array.flags.writeable:
+        array = array.copy()
+    return array
+
+
 class CountsStatistic(abc.ABC):
     """Counts statistics base class."""
 
@@ -38,16 +93,15 @@ class CountsStatistic(abc.ABC):
     def error(self):
         pass
 
-    @abc.abstractmethod
-    def _stat_fcn(self):
-        pass
-
-    @property
+    @cached_property
     def ts(self):
-        """Return stat difference (TS) of measured excess versus no excess."""
+        """Return stat difference (TS) of measured excess versus no excess.
+
+        Computed on first access and cached, so `sqrt_ts` and `p_value`
+        share one evaluation.
+        """
         # Remove (small) negative TS due to error in root finding
-        ts = np.clip(self.stat_null - self.stat_max, 0, None)
-        return ts
+        return np.maximum(self.stat_null - self.stat_max, 0)
 
     @property
     def sqrt_ts(self):
@@ -55,7 +109,7 @@ class CountsStatistic(abc.ABC):
 
         The sign of the excess is applied to distinguish positive and negative fluctuations.
         """
-        return np.sign(self.n_sig) * np.sqrt(self.ts)
+        return np.copysign(np.sqrt(self.ts), self.n_sig)
 
     @property
     def p_value(self):
@@ -63,7 +117,8 @@ class CountsStatistic(abc.ABC):
 
         Here the value accounts only for the positive excess significance (i.e. one-sided).
         """
-        return 0.5 * chi2.sf(self.ts, 1)
+        # chi2.sf(ts, 1) == erfc(sqrt(ts / 2)), as a single cheap ufunc
+        return 0.5 * erfc(np.sqrt(0.5 * self.ts))
 
     def __str__(self):
         str_ = "\t{:32}: {{n_on:.2f}} \n".format("Total counts")
@@ -100,6 +155,57 @@ class CountsStatistic(abc.ABC):
         info_dict["p_value"] = self.p_value
         return info_dict
 
+    @abc.abstractmethod
+    def _stat_fcn_array(self, mu, delta=0):
+        """Evaluate the fit statistic minus ``delta`` element-wise on full arrays."""
+        pass
+
+    @abc.abstractmethod
+    def _flattened(self):
+        """Return the statistic with all inputs broadcast and flattened to 1D."""
+        pass
+
+    def _solve_stat_roots(self, lower, upper, delta):
+        """Solve ``stat(mu) - delta = 0`` for all bins with one vectorized call.
+
+        Returns the roots with NaN where the solver did not converge in the
+        given bracket.
+        """
+        shape = np.shape(self.n_sig)
+        lower = _as_f8(np.broadcast_to(lower, shape)).ravel()
+        upper = _as_f8(np.broadcast_to(upper, shape)).ravel()
+        delta = _as_f8(np.broadcast_to(delta, shape)).ravel()
+
+        flat = self._flattened()
+
+        if is_numba_available() and lower.size >= JIT_ROOT_MIN_SIZE:
+            # large maps solve bin-parallel inside a prange kernel
+            roots = flat._solve_stat_roots_jit(lower, upper, delta)
+            if roots is not None:
+                return roots.reshape(shape)
+
+        if _chandrupatla is None:
+            # scipy without a vectorized bracketing solver
+            def fcn(mu):
+                return flat._stat_fcn_elementwise(mu, delta, *flat._solver_args())
+
+            return _bisect_stat_roots(fcn, lower, upper).reshape(shape)
+
+        # the per-bin arrays ride along as args so the solver keeps them
+        # aligned with the bins still being iterated
+        res = _chandrupatla(
+            self._stat_fcn_elementwise,
+            lower,
+            upper,
+            args=(delta,) + flat._solver_args(),
+        )
+        roots = np.where(res.success, res.x, np.nan)
+        return roots.reshape(shape)
+
+    def _solve_stat_roots_jit(self, lower, upper, delta):
+        """Statistic-specific parallel root kernel; None if not available."""
+        return None
+
     def compute_errn(self, n_sigma=1.0):
         """Compute downward excess uncertainties.
 
@@ -110,25 +216,13 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
         """
-        errn = np.zeros_like(self.n_sig, dtype="float")
-        min_range = self.n_sig - 2 * n_sigma * (self.error + 1)
-
-        it = np.nditer(errn, flags=["multi_index"])
-        while not it.finished:
-            roots, res = find_roots(
-                self._stat_fcn,
-                min_range[it.multi_index],
-                self.n_sig[it.multi_index],
-                nbin=1,
-                args=(self.stat_max[it.multi_index] + n_sigma**2, it.multi_index),
-            )
-            if np.isnan(roots[0]):
-                errn[it.multi_index] = self.n_on[it.multi_index]
-            else:
-                errn[it.multi_index] = self.n_sig[it.multi_index] - roots[0]
-            it.iternext()
+        n_sig = self.n_sig
+        min_range = n_sig - 2 * n_sigma * (self.error + 1)
 
-        return errn
+        roots = self._solve_stat_roots(
+            min_range, n_sig, delta=self.stat_max + n_sigma**2
+        )
+        return np.where(np.isnan(roots), self.n_on, n_sig - roots)
 
     def compute_errp(self, n_sigma=1):
         """Compute upward excess uncertainties.
@@ -140,22 +234,13 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
         """
-        errp = np.zeros_like(self.n_on, dtype="float")
-        max_range = self.n_sig + 2 * n_sigma * (self.error + 1)
-
-        it = np.nditer(errp, flags=["multi_index"])
-        while not it.finished:
-            roots, res = find_roots(
-                self._stat_fcn,
-                self.n_sig[it.multi_index],
-                max_range[it.multi_index],
-                nbin=1,
-                args=(self.stat_max[it.multi_index] + n_sigma**2, it.multi_index),
-            )
-            errp[it.multi_index] = roots[0]
-            it.iternext()
+        n_sig = self.n_sig
+        max_range = n_sig + 2 * n_sigma * (self.error + 1)
 
-        return errp - self.n_sig
+        roots = self._solve_stat_roots(
+            n_sig, max_range, delta=self.stat_max + n_sigma**2
+        )
+        return roots - n_sig
 
     def compute_upper_limit(self, n_sigma=3):
         """Compute upper limit on the signal.
@@ -169,25 +254,41 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the upper limit expressed in number of sigma. Default is 3.
         """
-        ul = np.zeros_like(self.n_on, dtype="float")
-
         min_range = self.n_sig
         max_range = min_range + 2 * n_sigma * (self.error + 1)
-        it = np.nditer(ul, flags=["multi_index"])
 
-        while not it.finished:
-            ts_ref = self._stat_fcn(min_range[it.multi_index], 0.0, it.multi_index)
+        # the reference statistic evaluated at min_range = n_sig is exactly
+        # the cached best-fit statistic, no extra evaluation needed
+        return self._solve_stat_roots(
+            min_range, max_range, delta=self.stat_max + n_sigma**2
+        )
 
-            roots, res = find_roots(
-                self._stat_fcn,
-                min_range[it.multi_index],
-                max_range[it.multi_index],
-                nbin=1,
-                args=(ts_ref + n_sigma**2, it.multi_index),
-            )
-            ul[it.multi_index] = roots[0]
-            it.iternext()
-        return ul
+    def evaluate_all(self, n_sigma=1.0, n_sigma_ul=3.0):
+        """Compute excess errors and upper limit in one batched pass.
+
+        The three solves share the cached ``stat_max``, ``n_sig`` and
+        ``error`` arrays, so calling this is cheaper than three separate
+        estimations on fresh statistic objects.
+
+        Parameters
+        ----------
+        n_sigma : float, optional
+            Confidence level of the uncertainties expressed in number of sigma.
+            Default is 1.
+        n_sigma_ul : float, optional
+            Confidence level of the upper limit expressed in number of sigma.
+            Default is 3.
+
+        Returns
+        -------
+        result : dict
+            Dictionary with the "errn", "errp" and "ul" arrays.
+        """
+        return {
+            "errn": self.compute_errn(n_sigma),
+            "errp": self.compute_errp(n_sigma),
+            "ul": self.compute_upper_limit(n_sigma_ul),
+        }
 
     @abc.abstractmethod
     def _n_sig_matching_significance_fcn(self):
@@ -208,26 +309,45 @@ class CountsStatistic(abc.ABC):
         n_sig : `numpy.ndarray`
             Excess.
         """
-        n_sig = np.zeros_like(self.n_bkg, dtype="float")
-        it = np.nditer(n_sig, flags=["multi_index"])
-
-        while not it.finished:
-            lower_bound = np.sqrt(self.n_bkg[it.multi_index]) * significance
-            # find upper bounds for secant method as in scipy
-            eps = 1e-4
-            upper_bound = lower_bound * (1 + eps)
-            upper_bound += eps if upper_bound >= 0 else -eps
-            roots, res = find_roots(
-                self._n_sig_matching_significance_fcn,
-                lower_bound=lower_bound,
-                upper_bound=upper_bound,
-                args=(significance, it.multi_index),
-                nbin=1,
-                method="secant",
-            )
-            n_sig[it.multi_index] = roots[0]  # return NaN if fail
-            it.iternext()
-        return n_sig
+        shape = np.shape(self.n_bkg)
+
+        # secant iteration advancing every bin together; each problem is an
+        # independent scalar root so the whole array shares the loop
+        x0 = np.atleast_1d(np.sqrt(self.n_bkg) * significance).astype(float)
+        # find upper bounds for secant method as in scipy; the branchless
+        # copysign handles the nudge direction for the whole array at once
+        eps = 1e-4
+        x1 = x0 * (1 + eps)
+        x1 += np.copysign(eps, x1)
+
+        tol, maxiter = 1.48e-8, 50
+        f0 = self._n_sig_matching_significance_fcn(x0, significance)
+        f1 = self._n_sig_matching_significance_fcn(x1, significance)
+
+        result = np.full(x0.shape, np.nan)
+        active = np.ones(x0.shape, dtype=bool)
+
+        for _ in range(maxiter):
+            denominator = f1 - f0
+            # stalled iterations fail and keep their NaN result
+            active &= denominator != 0
+            if not active.any():
+                break
+            with np.errstate(invalid="ignore", divide="ignore"):
+                step = f1 * (x1 - x0) / np.where(denominator == 0, 1, denominator)
+            x2 = np.where(active, x1 - step, x1)
+
+            done = active & (np.abs(x2 - x1) < tol)
+            result[done] = x2[done]
+            active &= ~done
+
+            x0, f0 = x1, f1
+            x1 = x2
+            if not active.any():
+                break
+            f1 = self._n_sig_matching_significance_fcn(x1, significance)
+
+        return result.reshape(shape)
 
     @abc.abstractmethod
     def sum(self, axis=None):
@@ -259,32 +379,40 @@ class CashCountsStatistic(CountsStatistic):
     """
 
     def __init__(self, n_on, mu_bkg):
-        self.n_on = np.asanyarray(n_on)
-        self.mu_bkg = np.asanyarray(mu_bkg)
+        # broadcast once at construction rather than on every evaluation
+        self.n_on, self.mu_bkg = np.broadcast_arrays(
+            np.asanyarray(n_on), np.asanyarray(mu_bkg)
+        )
 
     @property
     def n_bkg(self):
         """Expected background counts."""
         return self.mu_bkg
 
-    @property
+    @cached_property
     def n_sig(self):
-        """Excess."""
+        """Excess. Computed on first access and cached."""
         return self.n_on - self.n_bkg
 
-    @property
+    @cached_property
     def error(self):
-        """Approximate error from the covariance matrix."""
+        """Approximate error from the covariance matrix. Computed on first access and cached."""
         return np.sqrt(self.n_on)
 
-    @property
+    @cached_property
     def stat_null(self):
-        """Stat value for null hypothesis, i.e. 0 expected signal counts."""
+        """Stat value for null hypothesis, i.e. 0 expected signal counts.
+
+        Computed on first access and cached.
+        """
         return cash(self.n_on, self.mu_bkg + 0)
 
-    @property
+    @cached_property
     def stat_max(self):
-        """Stat value for best fit hypothesis, i.e. expected signal mu = n_on - mu_bkg."""
+        """Stat value for best fit hypothesis, i.e. expected signal mu = n_on - mu_bkg.
+
+        Computed on first access and cached.
+        """
         return cash(self.n_on, self.n_on)
 
     def info_dict(self):
@@ -307,13 +435,34 @@ class CashCountsStatistic(CountsStatistic):
         )
         return str_.expandtabs(tabsize=2)
 
-    def _stat_fcn(self, mu, delta=0, index=None):
-        return cash(self.n_on[index], self.mu_bkg[index] + mu) - delta
+    def _stat_fcn_array(self, mu, delta=0):
+        return self._stat_fcn_elementwise(mu, delta, self.n_on, self.mu_bkg)
 
-    def _n_sig_matching_significance_fcn(self, n_sig, significance, index):
-        TS0 = cash(n_sig + self.mu_bkg[index], self.mu_bkg[index])
-        TS1 = cash(n_sig + self.mu_bkg[index], self.mu_bkg[index] + n_sig)
-        return np.sign(n_sig) * np.sqrt(np.clip(TS0 - TS1, 0, None)) - significance
+    @staticmethod
+    def _stat_fcn_elementwise(mu, delta, n_on, mu_bkg):
+        if is_numba_available():
+            # compiled ufunc: broadcasting without intermediate arrays
+            return _jit_kernels().cash_minus_delta_jit(mu, n_on, mu_bkg, delta)
+        return cash(n_on, mu_bkg + mu) - delta
+
+    def _flattened(self):
+        n_on, mu_bkg = np.broadcast_arrays(self.n_on, self.mu_bkg)
+        return CashCountsStatistic(n_on=n_on.ravel(), mu_bkg=mu_bkg.ravel())
+
+    def _solver_args(self):
+        return (self.n_on, self.mu_bkg)
+
+    def _solve_stat_roots_jit(self, lower, upper, delta):
+        out = np.empty(lower.shape, dtype=np.float64)
+        _jit_kernels().cash_root_jit(
+            _as_f8(self.n_on), _as_f8(self.mu_bkg), delta, lower, upper, out
+        )
+        return out
+
+    def _n_sig_matching_significance_fcn(self, n_sig, significance):
+        TS0 = cash(n_sig + self.mu_bkg, self.mu_bkg)
+        TS1 = cash(n_sig + self.mu_bkg, self.mu_bkg + n_sig)
+        return np.copysign(np.sqrt(np.maximum(TS0 - TS1, 0)), n_sig) - significance
 
     def sum(self, axis=None):
         n_on = self.n_on.sum(axis=axis)
@@ -324,7 +473,8 @@ class CashCountsStatistic(CountsStatistic):
         return CashCountsStatistic(n_on=self.n_on[key], mu_bkg=self.n_bkg[key])
 
     def compute_errn(self, n_sigma=1.0):
-        result = np.zeros_like(self.n_on, dtype="float")
+        # every element is written below, no need to zero the buffer
+        result = np.empty(np.shape(self.n_on), dtype=np.float64)
         c = n_sigma**2 / 2
         mask = self.n_on > 0
         on = self.n_on[mask]
@@ -333,7 +483,7 @@ class CashCountsStatistic(CountsStatistic):
         return result
 
     def compute_errp(self, n_sigma=1.0):
-        result = np.zeros_like(self.n_on, dtype="float")
+        result = np.empty(np.shape(self.n_on), dtype=np.float64)
         c = n_sigma**2 / 2
         mask = self.n_on > 0
 
@@ -343,7 +493,7 @@ class CashCountsStatistic(CountsStatistic):
         return result
 
     def compute_upper_limit(self, n_sigma=3):
-        result = np.zeros_like(self.n_on, dtype="float")
+        result = np.empty(np.shape(self.n_on), dtype=np.float64)
         c = n_sigma**2 / 2
         mask = self.n_on > 0
 
@@ -356,7 +506,7 @@ class CashCountsStatistic(CountsStatistic):
         return result
 
     def n_sig_matching_significance(self, significance):
-        result = np.zeros_like(self.mu_bkg, dtype="float")
+        result = np.empty(np.shape(self.mu_bkg), dtype=np.float64)
         c = significance**2 / 2
         mask = self.mu_bkg > 0
 
@@ -384,40 +534,46 @@ class WStatCountsStatistic(CountsStatistic):
     """
 
     def __init__(self, n_on, n_off, alpha, mu_sig=None):
-        self.n_on = np.asanyarray(n_on)
-        self.n_off = np.asanyarray(n_off)
-        self.alpha = np.asanyarray(alpha)
-
         if mu_sig is None:
-            self.mu_sig = np.zeros_like(self.n_on)
-        else:
-            self.mu_sig = np.asanyarray(mu_sig)
+            mu_sig = 0
+
+        # broadcast once at construction rather than on every evaluation
+        self.n_on, self.n_off, self.alpha, self.mu_sig = np.broadcast_arrays(
+            np.asanyarray(n_on),
+            np.asanyarray(n_off),
+            np.asanyarray(alpha),
+            np.asanyarray(mu_sig),
+        )
 
-    @property
+    @cached_property
     def n_bkg(self):
-        """Known background computed alpha * n_off."""
+        """Known background computed alpha * n_off. Computed on first access and cached."""
         return self.alpha * self.n_off
 
-    @property
+    @cached_property
     def n_sig(self):
-        """Excess."""
+        """Excess. Computed on first access and cached."""
         return self.n_on - self.n_bkg - self.mu_sig
 
-    @property
+    @cached_property
     def error(self):
-        """Approximate error from the covariance matrix."""
+        """Approximate error from the covariance matrix. Computed on first access and cached."""
         return np.sqrt(self.n_on + self.alpha**2 * self.n_off)
 
-    @property
+    @cached_property
     def stat_null(self):
-        """Stat value for null hypothesis, i.e. mu_sig expected signal counts."""
+        """Stat value for null hypothesis, i.e. mu_sig expected signal counts.
+
+        Computed on first access and cached.
+        """
         return wstat(self.n_on, self.n_off, self.alpha, self.mu_sig)
 
-    @property
+    @cached_property
     def stat_max(self):
         """Stat value for best fit hypothesis.
 
         i.e. expected signal mu = n_on - alpha * n_off - mu_sig.
+        Computed on first access and cached.
         """
         return wstat(self.n_on, self.n_off, self.alpha, self.n_sig + self.mu_sig)
 
@@ -446,28 +602,51 @@ class WStatCountsStatistic(CountsStatistic):
         )
         return str_.expandtabs(tabsize=2)
 
-    def _stat_fcn(self, mu, delta=0, index=None):
-        return (
-            wstat(
-                self.n_on[index],
-                self.n_off[index],
-                self.alpha[index],
-                (mu + self.mu_sig[index]),
-            )
-            - delta
+    def _stat_fcn_array(self, mu, delta=0):
+        return self._stat_fcn_elementwise(
+            mu, delta, self.n_on, self.n_off, self.alpha, self.mu_sig
         )
 
-    def _n_sig_matching_significance_fcn(self, n_sig, significance, index):
-        stat0 = wstat(
-            n_sig + self.n_bkg[index], self.n_off[index], self.alpha[index], 0
+    @staticmethod
+    def _stat_fcn_elementwise(mu, delta, n_on, n_off, alpha, mu_sig):
+        if is_numba_available():
+            # compiled ufunc: broadcasting without intermediate arrays
+            return _jit_kernels().wstat_minus_delta_jit(
+                mu, n_on, n_off, alpha, mu_sig, delta
+            )
+        return wstat(n_on, n_off, alpha, mu + mu_sig) - delta
+
+    def _flattened(self):
+        n_on, n_off, alpha, mu_sig = np.broadcast_arrays(
+            self.n_on, self.n_off, self.alpha, self.mu_sig
         )
-        stat1 = wstat(
-            n_sig + self.n_bkg[index],
-            self.n_off[index],
-            self.alpha[index],
-            n_sig,
+        return WStatCountsStatistic(
+            n_on=n_on.ravel(),
+            n_off=n_off.ravel(),
+            alpha=alpha.ravel(),
+            mu_sig=mu_sig.ravel(),
         )
-        return np.sign(n_sig) * np.sqrt(np.clip(stat0 - stat1, 0, None)) - significance
+
+    def _solver_args(self):
+        return (self.n_on, self.n_off, self.alpha, self.mu_sig)
+
+    def _solve_stat_roots_jit(self, lower, upper, delta):
+        # pack one (n_on, n_off, alpha, mu_sig) row per bin so the kernel
+        # reads all inputs of a bin from a single cache line
+        packed = np.empty((lower.size, 4), dtype=np.float64)
+        packed[:, 0] = self.n_on
+        packed[:, 1] = self.n_off
+        packed[:, 2] = self.alpha
+        packed[:, 3] = self.mu_sig
+
+        out = np.empty(lower.shape, dtype=np.float64)
+        _jit_kernels().wstat_root_jit(packed, delta, lower, upper, out)
+        return out
+
+    def _n_sig_matching_significance_fcn(self, n_sig, significance):
+        stat0 = wstat(n_sig + self.n_bkg, self.n_off, self.alpha, 0)
+        stat1 = wstat(n_sig + self.n_bkg, self.n_off, self.alpha, n_sig)
+        return np.copysign(np.sqrt(np.maximum(stat0 - stat1, 0)), n_sig) - significance
 
     def sum(self, axis=None):
         n_on = self.n_on.sum(axis=axis)
@@ -1,6 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from numba import jit
+from numba import jit, prange, vectorize
 
 global TRUNCATION_VALUE  # compile time constant
 TRUNCATION_VALUE = 1e-25
@@ -142,3 +142,210 @@ def norm_bounds_jit(counts, background, model):
         b_min = np.nan
         b_max = np.nan
     return b_min, b_max, -sn_min_total
+
+
+@jit("f8(f8,f8,f8,f8)", nopython=True, nogil=True, cache=True)
+def _cash_minus_delta_scalar(mu, n_on, mu_bkg, delta):
+    trunc = TRUNCATION_VALUE
+    mu_on = mu_bkg + mu
+    if mu_on <= trunc:
+        mu_on = trunc
+    return 2 * (mu_on - n_on * np.log(mu_on)) - delta
+
+
+@jit("f8(f8,f8,f8,f8)", nopython=True, nogil=True, cache=True)
+def wstat_jit(n_on, n_off, alpha, mu_sig):
+    """WStat with profiled background, without goodness-of-fit terms.
+
+    Parameters
+    ----------
+    n_on : float
+        Total observed counts.
+    n_off : float
+        Total observed background counts.
+    alpha : float
+        Exposure ratio between on and off region.
+    mu_sig : float
+        Signal expected counts.
+    """
+    C = alpha * (n_on + n_off) - (1 + alpha) * mu_sig
+    D = np.sqrt(C**2 + 4 * alpha * (alpha + 1) * n_off * mu_sig)
+    mu_bkg = (C + D) / (2 * alpha * (alpha + 1))
+
+    stat = mu_sig + (1 + alpha) * mu_bkg
+    if n_on > 0:
+        stat -= n_on * np.log(mu_sig + alpha * mu_bkg)
+    if n_off > 0:
+        stat -= n_off * np.log(mu_bkg)
+
+    return 2 * stat
+
+
+@jit("f8(f8,f8,f8,f8)", nopython=True, nogil=True, cache=True)
+def _sqrt_ts_fcn(n_sig, n_off, alpha, significance):
+    """Value of sqrt(TS) - significance for a signal hypothesis n_sig."""
+    n_on = n_sig + alpha * n_off
+    ts = wstat_jit(n_on, n_off, alpha, 0.0) - wstat_jit(n_on, n_off, alpha, n_sig)
+    if ts < 0:
+        ts = 0.0
+    return np.sqrt(ts) - significance
+
+
+@jit(
+    "void(f8[:],f8[:],f8,i8,f8[:])",
+    nopython=True,
+    nogil=True,
+    cache=True,
+    parallel=True,
+)
+def n_sig_matching_significance_jit(n_off, alpha, significance, niter, out):
+    """Excess matching a given WStat significance, solved per bin by bisection.
+
+    Parameters
+    ----------
+    n_off : `~numpy.ndarray`
+        Measured counts in off region, flattened.
+    alpha : `~numpy.ndarray`
+        Acceptance ratio of on and off measurements, flattened.
+    significance : float
+        Significance to match.
+    niter : int
+        Number of bisection iterations.
+    out : `~numpy.ndarray`
+        Output array, filled with the matching excess per bin.
+    """
+    for i in prange(n_off.shape[0]):
+        lower = 0.0
+        upper = 5 * significance * np.sqrt(alpha[i] * n_off[i] + 1)
+
+        for _ in range(10):
+            if _sqrt_ts_fcn(upper, n_off[i], alpha[i], significance) >= 0:
+                break
+            upper *= 2
+
+        for _ in range(niter):
+            mid = 0.5 * (lower + upper)
+            if _sqrt_ts_fcn(mid, n_off[i], alpha[i], significance) >= 0:
+                upper = mid
+            else:
+                lower = mid
+
+        if _sqrt_ts_fcn(upper, n_off[i], alpha[i], significance) >= 0:
+            out[i] = 0.5 * (lower + upper)
+        else:
+            out[i] = np.nan
+
+
+@jit("f8(f8,f8)", nopython=True, nogil=True, cache=True)
+def _wstat_gof_terms(n_on, n_off):
+    """Goodness-of-fit terms of WStat, see `~gammapy.stats.get_wstat_gof_terms`."""
+    terms = 0.0
+    if n_on > 0:
+        terms -= 2 * n_on * (1 - np.log(n_on))
+    if n_off > 0:
+        terms -= 2 * n_off * (1 - np.log(n_off))
+    return terms
+
+
+@jit("f8(f8,f8,f8,f8,f8,f8)", nopython=True, nogil=True, cache=True)
+def _wstat_minus_delta_scalar(mu, n_on, n_off, alpha, mu_sig, delta):
+    stat = wstat_jit(n_on, n_off, alpha, mu + mu_sig)
+    return stat + _wstat_gof_terms(n_on, n_off) - delta
+
+
+@vectorize(["f8(f8,f8,f8,f8)"], nopython=True, cache=True)
+def cash_minus_delta_jit(mu, n_on, mu_bkg, delta):
+    """Cash statistic of ``mu_bkg + mu`` minus ``delta`` as a compiled ufunc.
+
+    Broadcasting over any input shapes comes for free and no intermediate
+    arrays are allocated.
+    """
+    return _cash_minus_delta_scalar(mu, n_on, mu_bkg, delta)
+
+
+@vectorize(["f8(f8,f8,f8,f8,f8,f8)"], nopython=True, cache=True)
+def wstat_minus_delta_jit(mu, n_on, n_off, alpha, mu_sig, delta):
+    """WStat of the signal hypothesis ``mu + mu_sig`` minus ``delta`` as a ufunc.
+
+    Profiles the background analytically and includes the goodness-of-fit
+    terms, matching `~gammapy.stats.wstat` with ``extra_terms=True``.
+    """
+    return _wstat_minus_delta_scalar(mu, n_on, n_off, alpha, mu_sig, delta)
+
+
+@jit(
+    "void(f8[:],f8[:],f8[:],f8[:],f8[:],f8[:])",
+    nopython=True,
+    nogil=True,
+    cache=True,
+    parallel=True,
+)
+def cash_root_jit(n_on, mu_bkg, delta, lower, upper, out):
+    """Per-bin bisection roots of ``cash(mu) - delta`` over a flat array.
+
+    Bins run in parallel through `numba.prange`; bins without a sign
+    change in their bracket get NaN.
+    """
+    for i in prange(n_on.shape[0]):
+        a, b = lower[i], upper[i]
+        fa = _cash_minus_delta_scalar(a, n_on[i], mu_bkg[i], delta[i])
+        fb = _cash_minus_delta_scalar(b, n_on[i], mu_bkg[i], delta[i])
+        if np.isnan(fa) or np.isnan(fb) or (fa > 0) == (fb > 0):
+            if fa == 0:
+                out[i] = a
+            elif fb == 0:
+                out[i] = b
+            else:
+                out[i] = np.nan
+            continue
+        for _ in range(80):
+            m = 0.5 * (a + b)
+            fm = _cash_minus_delta_scalar(m, n_on[i], mu_bkg[i], delta[i])
+            if (fm > 0) == (fa > 0):
+                a, fa = m, fm
+            else:
+                b = m
+        out[i] = 0.5 * (a + b)
+
+
+@jit(
+    "void(f8[:,:],f8[:],f8[:],f8[:],f8[:])",
+    nopython=True,
+    nogil=True,
+    cache=True,
+    parallel=True,
+)
+def wstat_root_jit(packed, delta, lower, upper, out):
+    """Per-bin bisection roots of ``wstat(mu) - delta`` over a flat array.
+
+    Bins run in parallel through `numba.prange`; bins without a sign
+    change in their bracket get NaN. ``packed`` holds one row of
+    ``(n_on, n_off, alpha, mu_sig)`` per bin, so each iteration reads its
+    inputs from a single cache line.
+    """
+    for i in prange(packed.shape[0]):
+        n_on, n_off, alpha, mu_sig = (
+            packed[i, 0],
+            packed[i, 1],
+            packed[i, 2],
+            packed[i, 3],
+        )
+        a, b = lower[i], upper[i]
+        fa = _wstat_minus_delta_scalar(a, n_on, n_off, alpha, mu_sig, delta[i])
+        fb = _wstat_minus_delta_scalar(b, n_on, n_off, alpha, mu_sig, delta[i])
+        if np.isnan(fa) or np.isnan(fb) or (fa > 0) == (fb > 0):
+            if fa == 0:
+                out[i] = a
+            elif fb == 0:
+                out[i] = b
+            else:
+                out[i] = np.nan
+            continue
+        for _ in range(80):
+            m = 0.5 * (a + b)
+            fm = _wstat_minus_delta_scalar(m, n_on, n_off, alpha, mu_sig, delta[i])
+            if (fm > 0) == (fa > 0):
+                a, fa = m, fm
+            else:
+                b = m
+        out[i] = 0.5 * (a + b)
@@ -195,6 +195,22 @@ def test_wstat_excess_matching_significance(n_off, alpha, significance, result):
     assert_allclose(excess, result, rtol=1e-2)
 
 
+@pytest.mark.parametrize(
+    "stat",
+    [
+        CashCountsStatistic([5, 0, 100, 1], [1, 0, 23, 20]),
+        WStatCountsStatistic([5, 10, 0, 1], [1, 5, 0, 20], [1, 0.3, 1.0, 1.0]),
+    ],
+)
+def test_evaluate_all(stat):
+    result = stat.evaluate_all(n_sigma=2, n_sigma_ul=3)
+
+    assert set(result) == {"errn", "errp", "ul"}
+    assert_allclose(result["errn"], stat.compute_errn(2))
+    assert_allclose(result["errp"], stat.compute_errp(2))
+    assert_allclose(result["ul"], stat.compute_upper_limit(3))
+
+
 def test_cash_sum():
     on = [1, 2, 3]
     bkg = [0.5, 0.7, 1.3]
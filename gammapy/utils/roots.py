@@ -1,17 +1,95 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utilities to find roots of a scalar function within a given range."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from scipy.optimize import RootResults, root_scalar
 import astropy.units as u
+from gammapy.utils.compilation import is_numba_available
 from gammapy.utils.interpolation import interpolation_scale
 
+
+def _adapt_elementwise_find_root(find_root):
+    """Wrap `scipy.optimize.elementwise.find_root` in the `_chandrupatla` call convention."""
+
+    def solver(f, a, b, args=(), xatol=None, xrtol=None, maxiter=None):
+        tolerances = {}
+        if xatol is not None:
+            tolerances["xatol"] = xatol
+        if xrtol is not None:
+            tolerances["xrtol"] = xrtol
+
+        kwargs = dict(args=args, tolerances=tolerances or None)
+        if maxiter is not None:
+            kwargs["maxiter"] = maxiter
+        return find_root(f, (a, b), **kwargs)
+
+    return solver
+
+
+# the vectorized bracketing solver: prefer the private scipy implementation,
+# fall back to the public elementwise API (scipy>=1.15) if it has moved, and
+# degrade to None so callers use their scalar or bisection fallbacks
 try:
-    BAD_RES = RootResults(
-        root=np.nan, iterations=0, function_calls=0, flag=0, method="brentq"
-    )
-except TypeError:
-    BAD_RES = RootResults(root=np.nan, iterations=0, function_calls=0, flag=0)
+    from scipy.optimize._chandrupatla import _chandrupatla
+except ImportError:
+    try:
+        from scipy.optimize.elementwise import find_root as _elementwise_find_root
+    except ImportError:
+        _chandrupatla = None
+    else:
+        _chandrupatla = _adapt_elementwise_find_root(_elementwise_find_root)
+
+_scan_brackets_jit = None
+
+
+def _get_scan_brackets_jit():
+    """Build (once) the jitted sign-change scan used by `find_roots`."""
+    global _scan_brackets_jit
+
+    if _scan_brackets_jit is None:
+        from numba import njit
+
+        @njit("i8(f8[:],i8[:])", nogil=True, cache=True)
+        def scan_brackets(fvals, out):
+            n = 0
+            sa = (fvals[0] > 0) - (fvals[0] < 0)
+            for j in range(fvals.shape[0] - 1):
+                sb = (fvals[j + 1] > 0) - (fvals[j + 1] < 0)
+                if sa != sb:
+                    out[n] = j
+                    n += 1
+                sa = sb
+            return n
+
+        _scan_brackets_jit = scan_brackets
+
+    return _scan_brackets_jit
+
+
+def _root_results(root, iterations, function_calls, flag, method="brentq"):
+    try:
+        return RootResults(
+            root=root,
+            iterations=iterations,
+            function_calls=function_calls,
+            flag=flag,
+            method=method,
+        )
+    except TypeError:
+        return RootResults(
+            root=root, iterations=iterations, function_calls=function_calls, flag=flag
+        )
+
+
+# shared "no solution" singleton; RootResults is never mutated after
+# construction, so every failed or empty bracket can reference this object
+BAD_RES = _root_results(root=np.nan, iterations=0, function_calls=0, flag=0)
+
+# solver families accepted by `find_roots`, hashed once at import time
+BRACKETING_METHODS = frozenset(("bisection", "brentq", "brenth", "ridder", "toms748"))
+DERIVATIVE_METHODS = frozenset(("secant", "newton", "halley"))
 
 
 def find_roots(
@@ -28,6 +106,7 @@ def find_roots(
     rtol=None,
     maxiter=None,
     options=None,
+    max_workers=None,
 ):
     """Find roots of a scalar function within a given range.
 
@@ -78,15 +157,20 @@ def find_roots(
     options : dict, optional
         A dictionary of solver options.
         See `~scipy.optimize.root_scalar` for details.
+    max_workers : int, optional
+        Number of threads used to solve multiple brackets concurrently.
+        The objective function must be thread-safe for this to be valid.
+        Default is None, so brackets are solved sequentially.
 
     Returns
     -------
     roots : `~astropy.units.Quantity`
-        The function roots.
+        The function roots as a flat NaN-padded array, so downstream
+        post-processing can stay vectorized (e.g. ``np.nanmin(roots)``).
 
     results : `~numpy.array`
-        An array of `~scipy.optimize.RootResults` which is an
-        object containing information about the convergence.
+        An array of `~scipy.optimize.RootResults`, parallel to ``roots``,
+        which is an object containing information about the convergence.
         If the solver failed to converge in a bracketing range
         the corresponding `roots` array element is NaN.
 
@@ -102,40 +186,109 @@ def find_roots(
         options=options,
     )
 
+    # strip units and validate the solver once, before any per-bracket work
     if isinstance(lower_bound, u.Quantity):
         unit = lower_bound.unit
         lower_bound = lower_bound.value
         upper_bound = u.Quantity(upper_bound).to_value(unit)
     else:
-        unit = 1
+        unit = None
+
+    bracketing = method in BRACKETING_METHODS
+
+    if not bracketing and method not in DERIVATIVE_METHODS:
+        raise ValueError(f'Unknown solver "{method}"')
 
     scale = interpolation_scale(points_scale)
     a = scale(lower_bound)
     b = scale(upper_bound)
     x = scale.inverse(np.linspace(a, b, nbin + 1))
+    vectorized = False
     if len(x) > 2:
-        signs = np.sign([f(xk, *args) for xk in x])
-        ind = np.nonzero(signs[:-1] != signs[1:])[0]
+        # evaluate the function on the full sample array at once if it
+        # supports array input, else fall back to a scalar scan; any error
+        # counts as "not vectorized", the scalar loop will re-raise real ones
+        try:
+            fvals = np.asanyarray(f(x, *args))
+            if fvals.shape != x.shape:
+                raise ValueError("function is not vectorized")
+            vectorized = True
+        except Exception:
+            fvals = np.array([f(xk, *args) for xk in x])
+        if is_numba_available():
+            # fused sign computation and neighbor comparison, no temporaries
+            scan_brackets = _get_scan_brackets_jit()
+            buffer = np.empty(fvals.size - 1, dtype=np.int64)
+            nfound = scan_brackets(
+                np.ascontiguousarray(fvals, dtype=np.float64), buffer
+            )
+            ind = buffer[:nfound]
+        else:
+            # boolean sign-bit transitions instead of a three-way np.sign;
+            # exact zeros are promoted to brackets on both sides as before
+            signbits = np.signbit(fvals)
+            change = signbits[:-1] ^ signbits[1:]
+            zeros = fvals == 0
+            if zeros.any():
+                change |= zeros[:-1] ^ zeros[1:]
+            ind = np.flatnonzero(change)
     else:
         ind = [0]
     nroots = max(1, len(ind))
-    roots = np.ones(nroots) * np.nan
-    results = np.array(nroots * [BAD_RES])
-
-    for k, idx in enumerate(ind):
-        bracket = [x[idx].item(), x[idx + 1].item()]
-        if method in ["bisection", "brentq", "brenth", "ridder", "toms748"]:
-            kwargs["bracket"] = bracket
-        elif method in ["secant", "newton", "halley"]:
-            kwargs["x0"] = bracket[0]
-            kwargs["x1"] = bracket[1]
+    roots = np.full(nroots, np.nan)
+    results = np.full(nroots, BAD_RES, dtype=object)
+
+    if vectorized and bracketing and len(ind) > 1 and _chandrupatla is not None:
+        # solve all brackets in one vectorized Chandrupatla call instead
+        # of one Python-level root_scalar invocation per bracket
+        res = _chandrupatla(
+            f,
+            x[ind],
+            x[ind + 1],
+            args=args,
+            xatol=xtol,
+            xrtol=rtol,
+            **({"maxiter": maxiter} if maxiter is not None else {}),
+        )
+        roots = np.where(res.success, res.x, np.nan)
+        for k in range(nroots):
+            results[k] = _root_results(
+                root=res.x[k],
+                iterations=int(res.nit[k]),
+                function_calls=int(res.nfev[k]),
+                flag=int(res.status[k]),
+            )
+        if unit is not None:
+            roots = roots * unit
+        return roots, results
+
+    def solve(idx):
+        kw = kwargs.copy()
+        if bracketing:
+            kw["bracket"] = [x[idx].item(), x[idx + 1].item()]
         else:
-            raise ValueError(f'Unknown solver "{method}"')
+            kw["x0"] = x[idx].item()
+            kw["x1"] = x[idx + 1].item()
         try:
-            res = root_scalar(f, **kwargs)
-            results[k] = res
-            if res.converged:
-                roots[k] = res.root
+            return root_scalar(f, **kw)
         except (RuntimeError, ValueError):
+            return None
+
+    if max_workers is not None and max_workers > 1 and len(ind) > 1:
+        # brackets are independent and scipy's solvers release the GIL
+        # while iterating, so they can be dispatched to a thread pool
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            solutions = executor.map(solve, ind)
+    else:
+        solutions = map(solve, ind)
+
+    for k, res in enumerate(solutions):
+        if res is None:
             continue
-    return roots * unit, results
+        results[k] = res
+        if res.converged:
+            roots[k] = res.root
+
+    if unit is not None:
+        roots = roots * unit
+    return roots, results
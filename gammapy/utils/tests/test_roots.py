@@ -39,6 +39,23 @@ class TestFindRoots:
             assert np.isnan(roots[0])
             assert res[0].iterations == 0
 
+    def test_max_workers(self):
+        # scalar-only function so the threaded per-bracket loop is exercised
+        def f(x):
+            return float(np.cos(x))
+
+        roots_serial, _ = find_roots(
+            f, lower_bound=self.lower_bound, upper_bound=self.upper_bound
+        )
+        roots_threaded, res = find_roots(
+            f,
+            lower_bound=self.lower_bound,
+            upper_bound=self.upper_bound,
+            max_workers=4,
+        )
+        assert_allclose(roots_threaded.value, roots_serial.value)
+        assert np.all([sol.converged for sol in res])
+
     def test_invalid_method(self):
         with pytest.raises(ValueError, match='Unknown solver "xfail"'):
             find_roots(